@@ -3,6 +3,7 @@ This module implements a class to resolve the symbolic references in condensed
 structure data.
 """
 
+from itertools import chain
 from typing import Dict, Any, List, Union
 
 
@@ -37,8 +38,9 @@ class BaseAdapter(object):
             # If only one to_site is provided turn it into a list
             to_sites = [to_sites]
 
-        return [distance for to_site in to_sites
-                for distance in self.distances[from_site][to_site]]
+        from_distances = self.distances[from_site]
+        return list(chain.from_iterable(
+            from_distances[to_site] for to_site in to_sites))
 
     def get_angle_details(self, from_site: int, to_sites: Union[int, List[int]],
                           connectivity: str) -> List[float]:
@@ -57,8 +59,9 @@ class BaseAdapter(object):
             # If only one to_site is provided turn it into a list
             to_sites = [to_sites]
 
-        return [angle for to_site in to_sites
-                for angle in self.angles[from_site][to_site][connectivity]]
+        from_angles = self.angles[from_site]
+        return list(chain.from_iterable(
+            from_angles[to_site][connectivity] for to_site in to_sites))
 
     @property
     def mineral(self) -> Dict[str, Union[str, int, bool]]:
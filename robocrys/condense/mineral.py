@@ -2,17 +2,21 @@
 This module provides tools for matching structures to known mineral class.
 """
 
-from itertools import islice
-from typing import List, Optional, Dict, Text, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Text, Any, Tuple
+
+try:
+    from importlib.resources import files
+except ImportError:
+    from importlib_resources import files
 
 import numpy as np
 from matminer.utils.io import load_dataframe_from_json
-from pkg_resources import resource_filename
+from pandas import DataFrame
 
-from pymatgen.analysis.prototypes import AflowPrototypeMatcher
+from pymatgen.analysis.structure_matcher import StructureMatcher
 from pymatgen.core.structure import IStructure
-from robocrys.condense.fingerprint import (get_structure_fingerprint,
-                                           get_fingerprint_distance)
+from robocrys.condense.fingerprint import get_structure_fingerprint
 
 
 class MineralMatcher(object):
@@ -39,6 +43,12 @@ class MineralMatcher(object):
         fingerprint_distance_cutoff: Cutoff to determine how similar a match
             must be to be returned. The distance is measured between the
             structural fingerprints in euclidean space.
+        aflow_distance_cutoff: If set, only AFLOW prototypes whose fingerprint
+            distance to the structure is below this cutoff will be tried in the
+            AFLOW structure matching. This makes matching quicker but can miss
+            prototypes that match structurally despite having dissimilar
+            fingerprints. Defaults to ``None``, in which case all prototypes
+            are tried.
     """
 
     def __init__(self,
@@ -46,16 +56,41 @@ class MineralMatcher(object):
                  initial_stol: float = 0.3,
                  initial_angle_tol: float = 5.,
                  use_fingerprint_matching: bool = True,
-                 fingerprint_distance_cutoff: float = 0.4):
-        db_file = resource_filename('robocrys.condense', 'mineral_db.json.gz')
-        self.mineral_db = load_dataframe_from_json(db_file)
+                 fingerprint_distance_cutoff: float = 0.4,
+                 aflow_distance_cutoff: Optional[float] = None):
         self.initial_ltol = initial_ltol
         self.initial_stol = initial_stol
         self.initial_angle_tol = initial_angle_tol
         self.fingerprint_distance_cutoff = fingerprint_distance_cutoff
         self.use_fingerprint_matching = use_fingerprint_matching
-        self._structure = None
+        self.aflow_distance_cutoff = aflow_distance_cutoff
         self._mineral_db = None
+        self._fingerprints = None
+        self._fingerprint_sq_norms = None
+        self._structures = None
+        self._minerals = None
+        self._ntypesp_buckets = None
+        self._structure_key = None
+        self._db_structures = None
+        self._db_minerals = None
+        self._db_distances = None
+        self._db_ranks = None
+
+    @property
+    def mineral_db(self) -> DataFrame:
+        """The mineral database as a :obj:`pandas.DataFrame`.
+
+        The database is only loaded the first time it is needed. The default
+        database is shared between all :obj:`MineralMatcher` instances, so it
+        should not be modified in place. Instead, assign a modified copy.
+        """
+        if self._mineral_db is None:
+            self._load_mineral_db()
+        return self._mineral_db
+
+    @mineral_db.setter
+    def mineral_db(self, mineral_db: DataFrame):
+        self._set_mineral_db(mineral_db)
 
     def get_best_mineral_name(self, structure: IStructure) -> Dict[Text, Any]:
         """Gets the "best" mineral name for a structure.
@@ -91,41 +126,40 @@ class MineralMatcher(object):
         """
         self._set_distance_matrix(structure)  # pre-calculate distance matrix
 
+        # the matches are only calculated when the previous matching step fails
         aflow_matches = self.get_aflow_matches(structure)
-
-        fingerprint_matches = self.get_fingerprint_matches(structure)
-        fingerprint_derived = self.get_fingerprint_matches(
-            structure, match_n_sp=False)
-
-        distance = -1
-        n_species_types_match = True
         if aflow_matches:
             # mineral db sorted by fingerprint distance so first result always
             # has a smaller distance
-            mineral = aflow_matches[0]['type']
+            return {'type': aflow_matches[0]['type'], 'distance': -1,
+                    'n_species_type_match': True}
 
-        elif fingerprint_matches and self.use_fingerprint_matching:
-            mineral = fingerprint_matches[0]['type']
-            distance = fingerprint_matches[0]['distance']
+        if self.use_fingerprint_matching:
+            fingerprint_matches = self.get_fingerprint_matches(structure)
+            if fingerprint_matches:
+                return {'type': fingerprint_matches[0]['type'],
+                        'distance': fingerprint_matches[0]['distance'],
+                        'n_species_type_match': True}
 
-        elif fingerprint_derived and self.use_fingerprint_matching:
-            mineral = fingerprint_derived[0]['type']
-            distance = fingerprint_derived[0]['distance']
-            n_species_types_match = False
+            fingerprint_derived = self.get_fingerprint_matches(
+                structure, match_n_sp=False)
+            if fingerprint_derived:
+                return {'type': fingerprint_derived[0]['type'],
+                        'distance': fingerprint_derived[0]['distance'],
+                        'n_species_type_match': False}
 
-        else:
-            mineral = None
-
-        return {'type': mineral, 'distance': distance,
-                'n_species_type_match': n_species_types_match}
+        return {'type': None, 'distance': -1, 'n_species_type_match': True}
 
     def get_aflow_matches(self, structure: IStructure,
                           ) -> Optional[List[Dict[Text, Any]]]:
         """Gets minerals for a structure by matching to AFLOW prototypes.
 
-        Overrides
-        :class:`pymatgen.analysis.aflow_prototypes.AflowPrototypeMatcher` to
-        only return matches to prototypes with known mineral names.
+        Follows the same algorithm as
+        :class:`pymatgen.analysis.aflow_prototypes.AflowPrototypeMatcher` but
+        only returns matches to prototypes with known mineral names. If
+        ``aflow_distance_cutoff`` is set, only prototypes with a fingerprint
+        distance below the cutoff are considered, in which case the matches
+        may differ from those of ``AflowPrototypeMatcher``.
 
         The AFLOW tolerance parameters (defined in the init method) are passed
         to a :class:`pymatgen.analysis.structure_matcher.StructureMatcher`
@@ -146,27 +180,40 @@ class MineralMatcher(object):
         """
         self._set_distance_matrix(structure)
 
-        # redefine AflowPrototypeMatcher._match_prototype function to run over
-        # our custom pandas DataFrame of AFLOW prototypes. This DataFrame only
-        # contains entries from the AFLOW database with mineral names. We
-        # have also pre-calculated the fingerprints and distances to make this
-        # quicker.
-        def _match_prototype(structure_matcher, s):
-            tags = []
-            for _, row in self._mineral_db.iterrows():
-                p = row['structure']
-                m = structure_matcher.fit_anonymous(p, s)
-                if m:
-                    tags.append(_get_row_data(row))
-            return tags
-
-        matcher = AflowPrototypeMatcher(
-            initial_ltol=self.initial_ltol,
-            initial_stol=self.initial_stol,
-            initial_angle_tol=self.initial_angle_tol)
-        matcher._match_prototype = _match_prototype
-
-        return matcher.get_prototypes(structure)
+        # our database only contains entries from the AFLOW database with
+        # mineral names. We have also pre-calculated the fingerprints and
+        # distances to make this quicker. As the prototypes are sorted by
+        # fingerprint distance, only the first n_candidates are close enough to
+        # be worth matching.
+        if self.aflow_distance_cutoff is None:
+            n_candidates = len(self._db_distances)
+        else:
+            n_candidates = np.searchsorted(self._db_distances,
+                                           self.aflow_distance_cutoff)
+
+        candidates = list(zip(self._db_structures[:n_candidates],
+                              self._db_minerals[:n_candidates],
+                              self._db_distances[:n_candidates]))
+
+        sm = StructureMatcher(ltol=self.initial_ltol, stol=self.initial_stol,
+                              angle_tol=self.initial_angle_tol)
+        matches = [c for c in candidates if sm.fit_anonymous(c[0], structure)]
+
+        # prototypes that fail to match cannot match at tighter tolerances, so
+        # only the previous matches need to be checked at each step
+        while len(matches) > 1:
+            sm.ltol *= 0.8
+            sm.stol *= 0.8
+            sm.angle_tol *= 0.8
+            matches = [c for c in matches if sm.fit_anonymous(c[0], structure)]
+            if sm.ltol < 0.01:
+                break
+
+        if not matches:
+            return None
+
+        return [{'type': mineral, 'distance': distance, 'structure': p}
+                for p, mineral, distance in matches]
 
     def get_fingerprint_matches(self,
                                 structure: IStructure,
@@ -197,23 +244,31 @@ class MineralMatcher(object):
         """
         self._set_distance_matrix(structure)
 
-        mineral_db = self._mineral_db
-
-        if mineral_name_constraint:
-            mineral_db = mineral_db[mineral_db["mineral"].str.lower() ==
-                                    mineral_name_constraint]
+        # minerals are sorted by distance so all matches are before the cutoff
+        n_rows = np.searchsorted(self._db_distances,
+                                 self.fingerprint_distance_cutoff)
 
         if match_n_sp:
-            ntypesp = structure.ntypesp
-            mineral_db = mineral_db[mineral_db['ntypesp'] == ntypesp]
+            # convert the database indices of minerals with the same number of
+            # species into their positions in the distance sorted arrays
+            bucket = self._ntypesp_buckets.get(structure.ntypesp, [])
+            indices = np.sort(self._db_ranks[bucket])
+            indices = indices[indices < n_rows]
+        else:
+            indices = np.arange(n_rows)
 
-        num_rows = mineral_db.shape[0]
-        max_n_matches = max_n_matches if max_n_matches else num_rows
-        max_n_matches = num_rows if max_n_matches > num_rows else max_n_matches
+        if mineral_name_constraint:
+            names = self._db_minerals[indices].astype(str)
+            indices = indices[np.char.lower(names) == mineral_name_constraint]
 
-        minerals = [_get_row_data(row)
-                    for i, row in islice(mineral_db.iterrows(), max_n_matches)
-                    if row['distance'] < self.fingerprint_distance_cutoff]
+        if max_n_matches:
+            indices = indices[:max_n_matches]
+
+        minerals = [{'type': mineral, 'distance': distance, 'structure': s}
+                    for mineral, distance, s in zip(
+                        self._db_minerals[indices],
+                        self._db_distances[indices],
+                        self._db_structures[indices])]
 
         return minerals if minerals else None
 
@@ -227,10 +282,14 @@ class MineralMatcher(object):
         Args:
             structure: A structure.
         """
-        if self._structure == structure and self._mineral_db is not None:
+        structure_key = _get_structure_key(structure)
+        if (self._structure_key == structure_key and
+                self._db_distances is not None):
             return
 
-        data = self.mineral_db.copy()
+        if self._mineral_db is None:
+            self._load_mineral_db()
+
         fingerprint = get_structure_fingerprint(structure)
 
         if np.linalg.norm(fingerprint) < 0.4:
@@ -239,14 +298,86 @@ class MineralMatcher(object):
             fingerprint = get_structure_fingerprint(
                 structure, prototype_match=False)
 
-        data['distance'] = data['fingerprint'].apply(
-            lambda x: get_fingerprint_distance(x, fingerprint))
+        # |a - b|^2 = |a|^2 + |b|^2 - 2 a.b avoids building the full matrix of
+        # differences between the structure and mineral fingerprints
+        sq_distances = (self._fingerprint_sq_norms + fingerprint @ fingerprint
+                        - 2 * (self._fingerprints @ fingerprint))
+        distances = np.sqrt(np.maximum(sq_distances, 0, out=sq_distances))
+        order = np.argsort(distances)
+
+        self._db_structures = self._structures[order]
+        self._db_minerals = self._minerals[order]
+        self._db_distances = distances[order]
+        self._db_ranks = np.empty_like(order)
+        self._db_ranks[order] = np.arange(len(order))
+        self._structure_key = structure_key
+
+    def _load_mineral_db(self):
+        """Utility func to load the default mineral database."""
+        self._set_mineral_db(*_load_default_mineral_db())
+
+    def _set_mineral_db(self, mineral_db: DataFrame,
+                        fingerprints: Optional[np.ndarray] = None,
+                        sq_norms: Optional[np.ndarray] = None):
+        """Utility func to set the mineral database and cache its columns.
+
+        Args:
+            mineral_db: The mineral database as a :obj:`pandas.DataFrame`.
+            fingerprints: The mineral fingerprints as a matrix. If ``None``,
+                they will be taken from the 'fingerprint' column of the
+                database.
+            sq_norms: The squared norms of the fingerprints. Required if
+                ``fingerprints`` is set.
+        """
+        if fingerprints is None:
+            fingerprints, sq_norms = _get_fingerprint_matrix(mineral_db)
+
+        self._mineral_db = mineral_db
+        self._fingerprints = fingerprints
+        self._fingerprint_sq_norms = sq_norms
+        self._structures = self._mineral_db['structure'].to_numpy()
+        self._minerals = self._mineral_db['mineral'].to_numpy()
+
+        ntypesp = self._mineral_db['ntypesp'].to_numpy()
+        self._ntypesp_buckets = {n: np.flatnonzero(ntypesp == n)
+                                 for n in np.unique(ntypesp).tolist()}
+
+        # any distances calculated against the previous database are invalid
+        self._structure_key = None
+        self._db_distances = None
+
+
+@lru_cache(maxsize=1)
+def _load_default_mineral_db() -> Tuple[DataFrame, np.ndarray, np.ndarray]:
+    """Utility function to load the mineral database.
+
+    The database is cached so that it is shared between all
+    :obj:`MineralMatcher` instances. The fingerprints are also returned as a
+    single matrix of shape (n_minerals, n_features), along with their squared
+    norms.
+    """
+    db_file = str(files('robocrys.condense').joinpath('mineral_db.json.gz'))
+    mineral_db = load_dataframe_from_json(db_file)
+    fingerprints, sq_norms = _get_fingerprint_matrix(mineral_db)
+    return mineral_db, fingerprints, sq_norms
+
+
+def _get_fingerprint_matrix(mineral_db: DataFrame
+                            ) -> Tuple[np.ndarray, np.ndarray]:
+    """Utility function to stack the mineral fingerprints into a matrix.
+
+    Returns:
+        The fingerprints as a matrix of shape (n_minerals, n_features) and
+        their squared norms.
+    """
+    fingerprints = np.stack(mineral_db['fingerprint'])
+    sq_norms = np.einsum('ij,ij->i', fingerprints, fingerprints)
+    return fingerprints, sq_norms
 
-        self._mineral_db = data.sort_values(by='distance')
-        self._structure = structure
 
+def _get_structure_key(structure: IStructure) -> Tuple[bytes, bytes, Tuple]:
+    """Utility function to get a cheap, hashable identity for a structure."""
+    return (structure.lattice.matrix.tobytes(),
+            structure.frac_coords.tobytes(),
+            tuple(map(str, structure.species)))
 
-def _get_row_data(row: Dict) -> Dict[Text, Any]:
-    """Utility function to extract mineral data from pandas `DataFrame` row."""
-    return {'type': row['mineral'], 'distance': row['distance'],
-            'structure': row['structure']}
@@ -7,7 +7,11 @@ Some functionality relies on having a working internet connection.
 import warnings
 from typing import Optional, Tuple
 
-from pkg_resources import resource_filename
+try:
+    from importlib.resources import files
+except ImportError:
+    from importlib_resources import files
+
 from pubchempy import get_compounds, BadRequestError
 
 from pymatgen import loadfn
@@ -34,7 +38,8 @@ class MoleculeNamer(object):
                 to last.
         """
 
-        db_file = resource_filename('robocrys.condense', 'molecule_db.json.gz')
+        db_file = str(
+            files('robocrys.condense').joinpath('molecule_db.json.gz'))
         self.molecule_db = loadfn(db_file)
         self.matched_molecules = {}
         self.use_online_pubchem = use_online_pubchem
@@ -20,6 +20,8 @@ from pymatgen.util.string import formula_double_format
 from robocrys.condense.fingerprint import get_site_fingerprints
 from robocrys.util import connected_geometries, get_el, defaultdict_to_dict
 
+_connected_geometries_set = frozenset(connected_geometries)
+
 
 class SiteAnalyzer(object):
     """Class to extract information on site geometry and bonding.
@@ -653,12 +655,10 @@ class SiteAnalyzer(object):
             else:
                 return [get_el_sp(el).iupac_ordering, el]
 
-        nnn_geometries = [nnn_site['geometry'] for nnn_site in nnn_sites]
-
         poly_formula = None
-        if (geometry['type'] in connected_geometries and
-                any([nnn_geometry['type'] in connected_geometries
-                     for nnn_geometry in nnn_geometries])):
+        if (geometry['type'] in _connected_geometries_set and
+                any(nnn_site['geometry']['type'] in _connected_geometries_set
+                    for nnn_site in nnn_sites)):
             nn_els = [get_el(nn_site['element']) for nn_site in nn_sites]
             comp = Composition("".join(nn_els))
             el_amt_dict = comp.get_el_amt_dict()
@@ -1,3 +1,7 @@
+import numpy as np
+
+from robocrys.condense.fingerprint import (get_structure_fingerprint,
+                                           get_fingerprint_distance)
 from robocrys.condense.mineral import MineralMatcher
 from robocrys.tests import RobocrysTest
 
@@ -53,6 +57,61 @@ class TestMineralMatcher(RobocrysTest):
             'structure' in matches[0] and matches[0]['structure'],
             msg="perovskite structure not present in match dictionary")
 
+        # test limiting the number of matches
+        matches = self.matcher.get_fingerprint_matches(self.tin_dioxide,
+                                                       max_n_matches=1)
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0]['type'], 'Hydrophilite')
+
+        # test limiting the matches to a mineral name
+        matches = self.matcher.get_fingerprint_matches(
+            self.tin_dioxide, mineral_name_constraint='rutile')
+        self.assertTrue(matches)
+        self.assertTrue(all(m['type'] == 'Rutile' for m in matches))
+
+    def test_get_fingerprint_matches_filters(self):
+        """Test combined fingerprint filters against a brute force search."""
+        for structure in [self.tin_dioxide, self.double_perov]:
+            for match_n_sp in [True, False]:
+                for max_n_matches in [None, 1, 2]:
+                    for name in [None, 'rutile', '(cubic) perovskite']:
+                        matches = self.matcher.get_fingerprint_matches(
+                            structure, max_n_matches=max_n_matches,
+                            match_n_sp=match_n_sp,
+                            mineral_name_constraint=name)
+                        reference = self._get_reference_matches(
+                            structure, max_n_matches=max_n_matches,
+                            match_n_sp=match_n_sp,
+                            mineral_name_constraint=name)
+
+                        matches = matches if matches else []
+                        self.assertEqual([m['type'] for m in matches],
+                                         [m[0] for m in reference])
+                        for match, (_, distance) in zip(matches, reference):
+                            self.assertAlmostEqual(match['distance'],
+                                                   distance)
+
+    def _get_reference_matches(self, structure, max_n_matches=None,
+                               match_n_sp=True, mineral_name_constraint=None):
+        """Get fingerprint matches by filtering the whole mineral database."""
+        fingerprint = get_structure_fingerprint(structure)
+        if np.linalg.norm(fingerprint) < 0.4:
+            fingerprint = get_structure_fingerprint(
+                structure, prototype_match=False)
+
+        mineral_db = self.matcher.mineral_db
+        rows = sorted(
+            (get_fingerprint_distance(row['fingerprint'], fingerprint),
+             row['mineral'], row['ntypesp'])
+            for _, row in mineral_db.iterrows())
+
+        matches = [(mineral, distance) for distance, mineral, ntypesp in rows
+                   if distance < self.matcher.fingerprint_distance_cutoff and
+                   (not match_n_sp or ntypesp == structure.ntypesp) and
+                   (not mineral_name_constraint or
+                    mineral.lower() == mineral_name_constraint)]
+        return matches[:max_n_matches] if max_n_matches else matches
+
     def test_get_best_mineral_name(self):
         """Test mineral name matching."""
         mineral_data = self.matcher.get_best_mineral_name(self.tin_dioxide)
@@ -64,3 +123,36 @@ class TestMineralMatcher(RobocrysTest):
         self.assertEqual(mineral_data['type'], '(Cubic) Perovskite')
         self.assertAlmostEqual(mineral_data['distance'], 0.116971854532)
         self.assertEqual(mineral_data['n_species_type_match'], False)
+
+    def test_aflow_distance_cutoff(self):
+        """Test limiting AFLOW matching by fingerprint distance."""
+        matcher = MineralMatcher(aflow_distance_cutoff=0.8)
+        for structure in [self.tin_dioxide, self.double_perov]:
+            self.assertEqual(matcher.get_best_mineral_name(structure),
+                             self.matcher.get_best_mineral_name(structure))
+
+        # Rutile has a fingerprint distance of 0.15 so should be skipped
+        matcher = MineralMatcher(aflow_distance_cutoff=0.1)
+        self.assertEqual(matcher.get_aflow_matches(self.tin_dioxide), None)
+
+        matcher = MineralMatcher(aflow_distance_cutoff=0.2)
+        matches = matcher.get_aflow_matches(self.tin_dioxide)
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0]['type'], 'Rutile')
+
+    def test_set_mineral_db(self):
+        """Test replacing the mineral database."""
+        matcher = MineralMatcher()
+        mineral_db = matcher.mineral_db
+        self.assertTrue('fingerprint' in mineral_db.columns)
+        self.assertTrue(MineralMatcher().mineral_db is mineral_db)
+
+        self.assertEqual(matcher.get_aflow_matches(
+            self.tin_dioxide)[0]['type'], 'Rutile')
+        matcher.mineral_db = mineral_db[mineral_db['mineral'] != 'Rutile']
+        matches = matcher.get_aflow_matches(self.tin_dioxide)
+        self.assertTrue(matches is None or
+                        all(m['type'] != 'Rutile' for m in matches))
+
+        # the shared database should not have been modified
+        self.assertTrue('Rutile' in self.matcher.mineral_db['mineral'].values)
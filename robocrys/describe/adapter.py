@@ -4,8 +4,8 @@ structure data.
 """
 
 import numpy as np
-from collections import namedtuple, defaultdict
-from typing import Dict, Any, List, Union
+from collections import namedtuple, defaultdict, Counter
+from typing import Dict, Any, List, Union, Tuple
 
 from pymatgen.core.periodic_table import get_el_sp
 from robocrys.adapter import BaseAdapter
@@ -55,6 +55,11 @@ class DescriptionAdapter(BaseAdapter):
         self.use_iupac_ordering = use_iupac_ordering
         self.sym_labels = {site_index: self.get_sym_label(site_index)
                            for site_index in self.sites.keys()}
+        self._component_groups: List[ComponentGroup] = None
+        self._nn_details: Dict[Tuple[int, bool],
+                               List[NeighborSiteDetails]] = {}
+        self._nnn_details: Dict[Tuple[int, bool],
+                                List[NextNeighborSiteDetails]] = {}
 
     def get_nearest_neighbor_details(self, site_index: int,
                                      group: bool = False
@@ -77,16 +82,19 @@ class DescriptionAdapter(BaseAdapter):
               nearest neighbor. Can be more than one site if
               ``group_by_element=True``.
         """
+        if (site_index, group) in self._nn_details:
+            return self._nn_details[(site_index, group)]
+
         nn_sites = self.sites[site_index]['nn']
 
         nn_dict = defaultdict(list)
-        for nn_site in set(nn_sites):
+        for nn_site, count in sorted(Counter(nn_sites).items()):
             element = self.sites[nn_site]['element']
             labels = self.sym_labels[nn_site]
             identity = (element,) if group else (element, labels)
 
             nn_dict[identity].append(
-                {'count': nn_sites.count(nn_site),
+                {'count': count,
                  'labels': labels,
                  'site': nn_site})
 
@@ -99,7 +107,9 @@ class DescriptionAdapter(BaseAdapter):
                 count=sum([nn_site['count'] for nn_site in nn_group]),
                 sym_label=self.get_sym_label(sites)))
 
-        return sorted(nn_details, key=self._site_order)
+        nn_details = sorted(nn_details, key=self._site_order)
+        self._nn_details[(site_index, group)] = nn_details
+        return nn_details
 
     def get_next_nearest_neighbor_details(self, site_index: int,
                                           group: bool = False
@@ -132,14 +142,18 @@ class DescriptionAdapter(BaseAdapter):
               ``group=True``.
             - ``poly_formula`` (``str``): The polyhedral formula.
         """
+        if (site_index, group) in self._nnn_details:
+            return self._nnn_details[(site_index, group)]
+
         nnn = self.sites[site_index]['nnn']
 
-        # get a list of tuples of (nnn_site_index, connectivity)
-        con_data = [(nnn_site_index, connectivity) for connectivity, sites in
-                    nnn.items() for nnn_site_index in set(sites)]
+        # get a list of tuples of (nnn_site_index, connectivity, count)
+        con_data = [(nnn_site_index, connectivity, count)
+                    for connectivity, sites in nnn.items()
+                    for nnn_site_index, count in sorted(Counter(sites).items())]
 
         nnn_dict = defaultdict(list)
-        for nnn_site, connectivity in con_data:
+        for nnn_site, connectivity, count in con_data:
             poly_formula = self.sites[nnn_site]['poly_formula']
             if not poly_formula:
                 # only interested in describing the connectivity to other
@@ -156,7 +170,7 @@ class DescriptionAdapter(BaseAdapter):
                 identity = (element, connectivity, geometry, labels)
 
             nnn_dict[identity].append(
-                {'count': nnn[connectivity].count(nnn_site),
+                {'count': count,
                  'labels': labels,
                  'site': nnn_site,
                  'poly_formula': poly_formula})
@@ -173,7 +187,9 @@ class DescriptionAdapter(BaseAdapter):
                 count=sum([nn_site['count'] for nn_site in nnn_group]),
                 sym_label=self.get_sym_label(sites)))
 
-        return sorted(nnn_details, key=self._site_order)
+        nnn_details = sorted(nnn_details, key=self._site_order)
+        self._nnn_details[(site_index, group)] = nnn_details
+        return nnn_details
 
     def get_component_details(self) -> List[ComponentDetails]:
         """Gets a summary of all components.
@@ -222,6 +238,9 @@ class DescriptionAdapter(BaseAdapter):
             - ``components`` (``list[ComponentDetails]``): The components
               in the group.
         """
+        if self._component_groups is not None:
+            return self._component_groups
+
         component_details = self.get_component_details()
 
         grouped_components = defaultdict(list)
@@ -240,7 +259,9 @@ class DescriptionAdapter(BaseAdapter):
                 components=sorted(group, key=_component_order),
                 nsites=group[0].nsites))
 
-        return sorted(component_group_details, key=_component_order)
+        self._component_groups = sorted(component_group_details,
+                                        key=_component_order)
+        return self._component_groups
 
     def get_component_site_groups(self, component_index: int
                                   ) -> List[SiteGroup]:
@@ -7,7 +7,13 @@ TODO:
     * Handle distortion in connected polyhedra description.
 """
 
-from typing import Dict, Any, Tuple, List, Union
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Tuple, List, Union, Iterable, Optional
+
+import numpy as np
 
 from pymatgen.util.string import latexify, unicodeify, htmlify
 from pymatgen.util.string import latexify_spacegroup
@@ -19,6 +25,68 @@ import inflect
 
 en = inflect.engine()
 
+# plurals for the fixed vocabulary of nouns used in the descriptions, these
+# can be looked up directly rather than going through the inflect rule tables
+_noun_plurals: Dict[str, str] = {
+    'atom': 'atoms', 'molecule': 'molecules', 'direction': 'directions',
+    'length': 'lengths', 'corner': 'corners', 'edge': 'edges',
+    'face': 'faces',
+    **{shape: shape + 's' for shape in dimensionality_to_shape.values()}}
+
+# words for the small integers typically encountered as site and neighbor counts
+_small_number_words: Tuple[str, ...] = tuple(
+    en.number_to_words(i) for i in range(32))
+
+# functions used to format formulas for each of the fmt options
+_formula_formatters = {"latex": latexify, "unicode": unicodeify,
+                       "html": htmlify}
+
+# counts which inflect treats as singular
+_singular_counts = frozenset(
+    ('1', 'a', 'an', 'one', 'each', 'every', 'this', 'that'))
+
+
+def _number_to_words(num: Union[int, str]) -> str:
+    """Fast version of :meth:`inflect.engine.number_to_words`.
+
+    Small integers are taken from a precomputed table.
+    """
+    if isinstance(num, int) and 0 <= num < len(_small_number_words):
+        return _small_number_words[num]
+    return en.number_to_words(num)
+
+
+def _plural(word: str, count: Union[int, str, None] = None) -> str:
+    """Fast version of :meth:`inflect.engine.plural`.
+
+    Nouns in the fixed description vocabulary bypass inflect entirely, other
+    words are passed to a cached call to inflect.
+    """
+    if word in _noun_plurals:
+        return word if str(count) in _singular_counts else _noun_plurals[word]
+    return _inflect_plural(word, count)
+
+
+@lru_cache(maxsize=512)
+def _inflect_plural(word: str, count: Union[int, str, None] = None) -> str:
+    """Cached version of :meth:`inflect.engine.plural`."""
+    return en.plural(word, count)
+
+
+@lru_cache(maxsize=64)
+def _plural_verb(verb: str, count: Union[int, str, None] = None) -> str:
+    """Cached version of :meth:`inflect.engine.plural_verb`."""
+    return en.plural_verb(verb, count)
+
+
+@lru_cache(maxsize=256)
+def _join(words: Tuple[Any, ...]) -> str:
+    """Cached version of :meth:`inflect.engine.join`.
+
+    The words must be provided as a :obj:`tuple` so they can be hashed.
+    """
+    return en.join(list(words))
+
 
 class StructureDescriber(object):
 
@@ -94,11 +162,20 @@ class StructureDescriber(object):
 
         self._da: DescriptionAdapter = None
         self._seen_bonds: set = None
+        self._cache: Dict[Tuple[int, Tuple], Tuple[
+            Dict[str, Any], DescriptionAdapter, set, Dict[str, str]]] = {}
+        self._max_cache_size = 32
 
     def describe(self, condensed_structure: Dict[str, Any]
                  ) -> Union[str, Dict[str, str]]:
         """Convert a condensed structure into a text description.
 
+        Descriptions are cached, so describing the same condensed structure
+        object again with the same describer options will not regenerate the
+        description. The condensed structure should therefore not be modified
+        in place between calls. On a cache hit, the adapter used by the other
+        ``get_*`` methods is restored to the one for this structure.
+
         Args:
             condensed_structure: The condensed structure data, formatted as
                 produced by :meth:`StructureCondenser.condense_structure`.
@@ -111,6 +188,94 @@ class StructureDescriber(object):
             keys 'mineral', 'component_makeup' and 'components', each containing
             the relevant part of the description.
         """
+        # the condensed structure is stored alongside the description so its
+        # id cannot be reused by another object while it is in the cache
+        key = (id(condensed_structure), self._get_options())
+        if key in self._cache:
+            _, self._da, self._seen_bonds, description = self._cache[key]
+
+        else:
+            description = self._get_description(condensed_structure)
+
+            if len(self._cache) >= self._max_cache_size:
+                # evict the oldest entry
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = (condensed_structure, self._da,
+                                self._seen_bonds, description)
+
+        if not self.return_parts:
+            return " ".join(
+                description[part] for part in
+                ['mineral', 'component_makeup', 'components']
+                if description[part] != "")
+        else:
+            return dict(description)
+
+    def describe_many(self, condensed_structures: Iterable[Dict[str, Any]],
+                      n_workers: Optional[int] = None,
+                      chunksize: Optional[int] = None
+                      ) -> List[Union[str, Dict[str, str]]]:
+        """Convert multiple condensed structures into text descriptions.
+
+        The structures are described in parallel using a pool of processes.
+
+        Args:
+            condensed_structures: The condensed structure data, formatted as
+                produced by :meth:`StructureCondenser.condense_structure`.
+            n_workers: The number of processes to use. If ``None``, the
+                number of processors on the machine will be used.
+            chunksize: The number of structures sent to a process at a time.
+                If ``None``, the structures will be split into roughly four
+                chunks per process.
+
+        Returns:
+            The descriptions, in the same order as ``condensed_structures``.
+            See :meth:`StructureDescriber.describe` for the format of each
+            description.
+        """
+        condensed_structures = list(condensed_structures)
+        n_workers = n_workers if n_workers else os.cpu_count() or 1
+
+        if not chunksize:
+            chunksize = max(1, len(condensed_structures) // (4 * n_workers))
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            return list(executor.map(self.describe, condensed_structures,
+                                     chunksize=chunksize))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the adapter and description cache are specific to this process so
+        # don't copy them to worker processes
+        state = self.__dict__.copy()
+        state.update(_da=None, _seen_bonds=None, _cache={})
+        return state
+
+    def _get_options(self) -> Tuple:
+        """Gets the options that affect the description text.
+
+        Returns:
+            The option values as a :obj:`tuple`, for use in the cache key.
+        """
+        return (self.describe_mineral, self.describe_component_makeup,
+                self.describe_components, self.describe_symmetry_labels,
+                self.describe_oxidation_state, self.describe_bond_lengths,
+                self.bond_length_decimal_places, self.distorted_tol,
+                self.cation_polyhedra_only, self.only_describe_bonds_once,
+                self.fmt, self.angle_decimal_places, self.angstrom,
+                self.degree)
+
+    def _get_description(self, condensed_structure: Dict[str, Any]
+                         ) -> Dict[str, str]:
+        """Generates the individual parts of the description.
+
+        Args:
+            condensed_structure: The condensed structure data, formatted as
+                produced by :meth:`StructureCondenser.condense_structure`.
+
+        Returns:
+            The description as a :obj:`dict` with the keys 'mineral',
+            'component_makeup' and 'components'.
+        """
         self._da = DescriptionAdapter(condensed_structure)
         self._seen_bonds = set()
 
@@ -126,13 +291,7 @@ class StructureDescriber(object):
         if self.describe_components:
             description['components'] = self.get_all_component_descriptions()
 
-        if not self.return_parts:
-            return " ".join(
-                description[part] for part in
-                ['mineral', 'component_makeup', 'components']
-                if description[part] is not "")
-        else:
-            return description
+        return description
 
     def get_mineral_description(self) -> str:
         """Gets the mineral name and space group description.
@@ -150,27 +309,26 @@ class StructureDescriber(object):
         spg_symbol = self._da.spg_symbol
         formula = self._da.formula
         if self.fmt == "latex":
-            spg_symbol = latexify_spacegroup(self._da.spg_symbol)
+            spg_symbol = latexify_spacegroup(spg_symbol)
             formula = latexify(formula)
 
         elif self.fmt == "unicode":
-            spg_symbol = unicodeify_spacegroup(self._da.spg_symbol)
+            spg_symbol = unicodeify_spacegroup(spg_symbol)
             formula = unicodeify(formula)
 
         elif self.fmt == "html":
-            spg_symbol = htmlify_spacegroup(self._da.spg_symbol)
+            spg_symbol = htmlify_spacegroup(spg_symbol)
             formula = htmlify(formula)
 
         mineral_name = get_mineral_name(self._da.mineral)
 
         if mineral_name:
-            desc = "{} is {} structured and".format(formula, mineral_name)
+            s_mineral = f" is {mineral_name} structured and"
         else:
-            desc = "{}".format(formula)
+            s_mineral = ""
 
-        desc += " crystallizes in the {} {} space group.".format(
-            self._da.crystal_system, spg_symbol)
-        return desc
+        return (f"{formula}{s_mineral} crystallizes in the "
+                f"{self._da.crystal_system} {spg_symbol} space group.")
 
     def get_component_makeup_summary(self) -> str:
         """Gets a summary of the makeup of components in a structure.
@@ -183,68 +341,66 @@ class StructureDescriber(object):
 
         if (len(component_groups) == 1 and component_groups[0].count == 1 and
                 component_groups[0].dimensionality == 3):
-            desc = ""
+            return ""
 
+        structure_dimensionality = self._da.dimensionality
+        if structure_dimensionality == 3:
+            s_intro = "The structure consists of "
         else:
-            if self._da.dimensionality == 3:
-                desc = "The structure consists of "
+            s_dimensionality = _number_to_words(structure_dimensionality)
+            s_intro = (f"The structure is {s_dimensionality}-dimensional and "
+                       "consists of ")
+
+        component_makeup_summaries = []
+        nframeworks = len([c for g in component_groups
+                           for c in g.components if c.dimensionality == 3])
+        format_formula = _formula_formatters.get(self.fmt, str)
+        for component_group in component_groups:
+            if nframeworks == 1 and component_group.dimensionality == 3:
+                s_count = "a"
             else:
-                desc = ("The structure is {}-dimensional and consists of "
-                        "".format(en.number_to_words(self._da.dimensionality)))
-
-            component_makeup_summaries = []
-            nframeworks = len([c for g in component_groups
-                               for c in g.components if c.dimensionality == 3])
-            for component_group in component_groups:
-                if nframeworks == 1 and component_group.dimensionality == 3:
-                    s_count = "a"
-                else:
-                    s_count = en.number_to_words(component_group.count)
+                s_count = _number_to_words(component_group.count)
 
-                dimensionality = component_group.dimensionality
+            dimensionality = component_group.dimensionality
 
-                if component_group.molecule_name:
-                    if component_group.nsites == 1:
-                        shape = "atom"
-                    else:
-                        shape = "molecule"
-                    shape = en.plural(shape, s_count)
-                    formula = component_group.molecule_name
+            if component_group.molecule_name:
+                if component_group.nsites == 1:
+                    shape = "atom"
                 else:
-                    shape = en.plural(dimensionality_to_shape[dimensionality],
-                                      s_count)
-                    formula = component_group.formula
-
-                if self.fmt == "latex":
-                    formula = latexify(formula)
-                elif self.fmt == "unicode":
-                    formula = unicodeify(formula)
-                    print(formula)
-                elif self.fmt == "html":
-                    formula = htmlify(formula)
-
-                comp_desc = "{} {} {}".format(s_count, formula, shape)
-
-                if component_group.dimensionality in [1, 2]:
-                    orientations = list(set(c.orientation for c in
-                                            component_group.components))
-                    s_direction = en.plural("direction", len(orientations))
-                    comp_desc += " oriented in the {} {}".format(
-                        en.join(orientations), s_direction)
-
-                component_makeup_summaries.append(comp_desc)
-
-            if nframeworks == 1 and len(component_makeup_summaries) > 1:
-                # when there is a single framework, make the description read
-                # "... and 8 Sn atoms inside a SnO2 framework" instead of
-                # "..., 8 Sn atoms and one SnO2 framework"
-                # This works because the component summaries are sorted by
-                # dimensionality
-                desc += en.join(component_makeup_summaries[:-1])
-                desc += " inside {}.".format(component_makeup_summaries[-1])
+                    shape = "molecule"
+                shape = _plural(shape, s_count)
+                formula = component_group.molecule_name
+            else:
+                shape = _plural(dimensionality_to_shape[dimensionality],
+                                s_count)
+                formula = component_group.formula
+
+            formula = format_formula(formula)
+
+            if component_group.dimensionality in [1, 2]:
+                orientations = tuple(sorted({c.orientation for c in
+                                             component_group.components}))
+                s_direction = _plural("direction", len(orientations))
+                s_orientation = (" oriented in the "
+                                 f"{_join(orientations)} {s_direction}")
             else:
-                desc += en.join(component_makeup_summaries) + "."
-        return desc
+                s_orientation = ""
+
+            component_makeup_summaries.append(
+                f"{s_count} {formula} {shape}{s_orientation}")
+
+        if nframeworks == 1 and len(component_makeup_summaries) > 1:
+            # when there is a single framework, make the description read
+            # "... and 8 Sn atoms inside a SnO2 framework" instead of
+            # "..., 8 Sn atoms and one SnO2 framework"
+            # This works because the component summaries are sorted by
+            # dimensionality
+            s_components = (f"{en.join(component_makeup_summaries[:-1])} "
+                            f"inside {component_makeup_summaries[-1]}")
+        else:
+            s_components = en.join(component_makeup_summaries)
+
+        return f"{s_intro}{s_components}."
 
     def get_all_component_descriptions(self) -> str:
         """Gets the descriptions of all components in the structure.
@@ -252,42 +408,37 @@ class StructureDescriber(object):
         Returns:
             A description of all components in the structure.
         """
-        if len(self._da.components) == 1:
+        components = self._da.components
+        if len(components) == 1:
             return self.get_component_description(
-                self._da.get_component_groups()[0].components[0].index,
-                single_component=True)
+                next(iter(components)), single_component=True)
 
         else:
             component_groups = self._da.get_component_groups()
 
             component_descriptions = []
+            format_formula = _formula_formatters.get(self.fmt, str)
             for group in component_groups:
-                for component in group.components:
+                if group.molecule_name:
+                    # don't describe known molecules
+                    continue
 
-                    if group.molecule_name:
-                        # don't describe known molecules
-                        continue
+                formula = format_formula(group.formula)
+                group_count = group.count
+                shape_singular = dimensionality_to_shape[group.dimensionality]
+                shape_plural = _plural(shape_singular)
 
-                    formula = group.formula
-                    group_count = group.count
+                for component in group.components:
                     component_count = component.count
-                    shape = dimensionality_to_shape[group.dimensionality]
-
-                    if self.fmt == "latex":
-                        formula = latexify(formula)
-                    elif self.fmt == "unicode":
-                        formula = unicodeify(formula)
-                    elif self.fmt == "html":
-                        formula = htmlify(formula)
 
                     if group_count == component_count:
                         s_filler = "the" if group_count == 1 else "each"
+                        shape = shape_singular
                     else:
-                        s_filler = "{} of the".format(
-                            en.number_to_words(component_count))
-                        shape = en.plural(shape)
+                        s_filler = f"{_number_to_words(component_count)} of the"
+                        shape = shape_plural
 
-                    desc = "In {} {} {}, ".format(s_filler, formula, shape)
+                    desc = f"In {s_filler} {formula} {shape}, "
                     desc += self.get_component_description(component.index)
 
                     component_descriptions.append(desc)
@@ -325,15 +476,14 @@ class StructureDescriber(object):
                 else:
                     s_there = "There"
 
-                s_count = en.number_to_words(len(site_group.sites))
+                s_count = _number_to_words(len(site_group.sites))
 
-                desc.append("{} are {} inequivalent {} sites.".format(
-                    s_there, s_count, element))
+                desc.append(
+                    f"{s_there} are {s_count} inequivalent {element} sites.")
 
                 for i, site in enumerate(site_group.sites):
-                    s_ordinal = en.number_to_words(en.ordinal(i + 1))
-                    desc.append("In the {} {} site,".format(
-                        s_ordinal, element))
+                    s_ordinal = _number_to_words(en.ordinal(i + 1))
+                    desc.append(f"In the {s_ordinal} {element} site,")
                     desc.append(self.get_site_description(site))
 
             first_group = False
@@ -353,12 +503,13 @@ class StructureDescriber(object):
         """
         site = self._da.sites[site_index]
 
+        desc = []
         if (site['poly_formula'] and
                 (self.cation_polyhedra_only or '+' in site['element'])):
-            desc = self._get_poly_site_description(site_index)
+            desc.append(self._get_poly_site_description(site_index))
             tilt_desc = self.get_octahedral_tilt_description(site_index)
             if tilt_desc:
-                desc += ". " + tilt_desc
+                desc.append(tilt_desc)
         else:
             element = get_formatted_el(
                 site['element'], self._da.sym_labels[site_index],
@@ -372,18 +523,18 @@ class StructureDescriber(object):
                 s_geometry = ""
             s_geometry += site['geometry']['type']
 
-            desc = "{} is bonded in {} geometry to ".format(
-                element, en.a(s_geometry))
-            desc += self._get_nearest_neighbor_description(site_index)
+            nn_desc = self._get_nearest_neighbor_description(site_index)
+            desc.append(f"{element} is bonded in {en.a(s_geometry)} geometry "
+                        f"to {nn_desc}")
 
         bond_length_desc = self._get_nearest_neighbor_bond_length_descriptions(
             site_index)
         if bond_length_desc:
-            desc += ". " + bond_length_desc
+            desc.append(bond_length_desc)
         else:
-            desc += "."
+            desc[-1] += "."
 
-        return desc
+        return ". ".join(desc)
 
     def _get_poly_site_description(self, site_index: int):
         """Gets a description of a connected polyhedral site.
@@ -407,15 +558,9 @@ class StructureDescriber(object):
             use_sym_label=self.describe_symmetry_labels,
             fmt=self.fmt)
 
-        from_poly_formula = site['poly_formula']
-        if self.fmt == "latex":
-            from_poly_formula = latexify(from_poly_formula)
-        elif self.fmt == "unicode":
-            from_poly_formula = unicodeify(from_poly_formula)
-        elif self.fmt == "html":
-            from_poly_formula = htmlify(from_poly_formula)
-
-        s_from_poly_formula = get_el(site['element']) + from_poly_formula
+        format_formula = _formula_formatters.get(self.fmt, str)
+        s_from_poly_formula = (get_el(site['element']) +
+                               format_formula(site['poly_formula']))
 
         if site['geometry']['likeness'] < self.distorted_tol:
             s_distorted = "distorted "
@@ -425,41 +570,31 @@ class StructureDescriber(object):
         s_polyhedra = polyhedra_plurals[s_polyhedra]
 
         nn_desc = self._get_nearest_neighbor_description(site_index)
-        desc = "{} is bonded to {} to form ".format(from_element, nn_desc)
+        desc = f"{from_element} is bonded to {nn_desc} to form "
 
         # handle the case we were are connected to the same type of polyhedra
         if (nnn_details[0].element == site['element'] and
-            len(set([(nnn_site.element, nnn_site.poly_formula) for nnn_site in
-                     nnn_details]))) == 1:
-            connectivities = list(set([nnn_site.connectivity
-                                       for nnn_site in nnn_details]))
+            len({(nnn_site.element, nnn_site.poly_formula) for nnn_site in
+                 nnn_details})) == 1:
+            connectivities = tuple(sorted({nnn_site.connectivity
+                                           for nnn_site in nnn_details}))
             s_mixture = "a mixture of " if len(connectivities) != 1 else ""
-            s_connectivities = en.join(connectivities)
+            s_connectivities = _join(connectivities)
 
-            desc += "{}{}{}-sharing {} {}".format(
-                s_mixture, s_distorted, s_connectivities, s_from_poly_formula,
-                s_polyhedra)
-            return desc
+            return (f"{desc}{s_mixture}{s_distorted}{s_connectivities}-sharing "
+                    f"{s_from_poly_formula} {s_polyhedra}")
 
         # otherwise loop through nnn connectivities and describe individually
-        desc += "{}{} {} that share ".format(s_distorted, s_from_poly_formula,
-                                             s_polyhedra)
+        desc += f"{s_distorted}{s_from_poly_formula} {s_polyhedra} that share "
         nnn_descriptions = []
+        use_sym_label = self.describe_symmetry_labels
         for nnn_site in nnn_details:
             to_element = get_formatted_el(
                 nnn_site.element, nnn_site.sym_label,
                 use_oxi_state=False,
-                use_sym_label=self.describe_symmetry_labels)
-
-            to_poly_formula = nnn_site.poly_formula
-            if self.fmt == "latex":
-                to_poly_formula = latexify(to_poly_formula)
-            elif self.fmt == "unicode":
-                to_poly_formula = unicodeify(to_poly_formula)
-            elif self.fmt == "html":
-                to_poly_formula = htmlify(to_poly_formula)
+                use_sym_label=use_sym_label)
 
-            to_poly_formula = to_element + to_poly_formula
+            to_poly_formula = to_element + format_formula(nnn_site.poly_formula)
             to_shape = geometry_to_polyhedra[nnn_site.geometry]
 
             if len(nnn_site.sites) == 1 and nnn_site.count != 1:
@@ -468,15 +603,16 @@ class StructureDescriber(object):
                 s_equivalent = " "
 
             if nnn_site.count == 1:
-                s_an = " {}".format(en.an(nnn_site.connectivity))
+                s_an = f" {en.an(nnn_site.connectivity)}"
             else:
                 s_an = ""
                 to_shape = polyhedra_plurals[to_shape]
 
-            nnn_descriptions.append("{}{} with {}{}{} {}".format(
-                s_an, en.plural(nnn_site.connectivity, nnn_site.count),
-                en.number_to_words(nnn_site.count), s_equivalent,
-                to_poly_formula, to_shape))
+            s_connectivity = _plural(nnn_site.connectivity, nnn_site.count)
+            s_count = _number_to_words(nnn_site.count)
+            nnn_descriptions.append(
+                f"{s_an}{s_connectivity} with {s_count}{s_equivalent}"
+                f"{to_poly_formula} {to_shape}")
 
         return desc + en.join(nnn_descriptions)
 
@@ -496,26 +632,30 @@ class StructureDescriber(object):
         nn_details = self._da.get_nearest_neighbor_details(
             site_index, group=not self.describe_symmetry_labels)
 
+        use_oxi_state = self.describe_oxidation_state
+        use_sym_label = self.describe_symmetry_labels
+        fmt = self.fmt
+
         last_count = 0
         nn_descriptions = []
         for nn_site in nn_details:
             element = get_formatted_el(
                 nn_site.element, nn_site.sym_label,
-                use_oxi_state=self.describe_oxidation_state,
-                use_sym_label=self.describe_symmetry_labels,
-                fmt=self.fmt)
+                use_oxi_state=use_oxi_state,
+                use_sym_label=use_sym_label,
+                fmt=fmt)
 
             if len(nn_site.sites) == 1 and nn_site.count != 1:
                 s_equivalent = " equivalent "
             else:
                 s_equivalent = " "
 
-            nn_descriptions.append("{}{}{}".format(
-                en.number_to_words(nn_site.count), s_equivalent, element))
+            nn_descriptions.append(
+                f"{_number_to_words(nn_site.count)}{s_equivalent}{element}")
             last_count = nn_site.count
 
         s_atoms = "atom" if last_count == 1 else "atoms"
-        return "{} {}".format(en.join(nn_descriptions), s_atoms)
+        return f"{en.join(nn_descriptions)} {s_atoms}"
 
     def _get_nearest_neighbor_bond_length_descriptions(self, site_index: int
                                                        ) -> str:
@@ -576,41 +716,39 @@ class StructureDescriber(object):
 
         # if only one bond length
         if len(dists) == 1:
-            return "The {}–{} bond length is {}.".format(
-                from_element, to_element, self._distance_to_string(dists[0]))
+            return (f"The {from_element}–{to_element} bond length is "
+                    f"{self._distance_to_string(dists[0])}.")
 
         discrete_bond_lengths = self._rounded_bond_lengths(dists)
+        bond_length_counts = Counter(discrete_bond_lengths)
 
         # if multiple bond lengths but they are all the same
-        if len(set(discrete_bond_lengths)) == 1:
+        if len(bond_length_counts) == 1:
             s_intro = "Both" if len(discrete_bond_lengths) == 2 else "All"
-            return "{} {}–{} bond lengths are {}.".format(
-                s_intro, from_element, to_element,
-                self._distance_to_string(dists[0]))
+            return (f"{s_intro} {from_element}–{to_element} bond lengths are "
+                    f"{self._distance_to_string(dists[0])}.")
 
         # if two sets of bond lengths
-        if len(set(discrete_bond_lengths)) == 2:
-            small = min(discrete_bond_lengths)
-            s_small_count = en.number_to_words(discrete_bond_lengths.count(
-                small))
-            big = max(discrete_bond_lengths)
-            s_big_count = en.number_to_words(discrete_bond_lengths.count(big))
-
-            s_length = en.plural('length', s_big_count)
-
-            return ("There {} {} shorter ({}) and {} "
-                    "longer ({}) {}–{} bond {}.").format(
-                en.plural_verb('is', s_small_count), s_small_count,
-                self._distance_to_string(small), s_big_count,
-                self._distance_to_string(big), from_element, to_element,
-                s_length)
+        if len(bond_length_counts) == 2:
+            small, big = min(bond_length_counts), max(bond_length_counts)
+            s_small_count = _number_to_words(bond_length_counts[small])
+            s_big_count = _number_to_words(bond_length_counts[big])
+
+            s_length = _plural('length', s_big_count)
+
+            s_is = _plural_verb('is', s_small_count)
+            s_small = self._distance_to_string(small)
+            s_big = self._distance_to_string(big)
+
+            return (f"There {s_is} {s_small_count} shorter ({s_small}) and "
+                    f"{s_big_count} longer ({s_big}) {from_element}–"
+                    f"{to_element} bond {s_length}.")
 
         # otherwise just detail the spread of bond lengths
-        return ("There are a spread of {}–{} bond distances ranging from "
-                "{}.").format(
-            from_element, to_element,
-            self._distance_range_to_string(min(discrete_bond_lengths),
-                                           max(discrete_bond_lengths)))
+        s_range = self._distance_range_to_string(min(bond_length_counts),
+                                                 max(bond_length_counts))
+        return (f"There are a spread of {from_element}–{to_element} bond "
+                f"distances ranging from {s_range}.")
 
     def get_octahedral_tilt_description(self, site_index: int,
                                         ) -> str:
@@ -645,12 +783,12 @@ class StructureDescriber(object):
                 return "The corner-sharing octahedra are not tilted"
 
             else:
-                return ("The corner-sharing octahedral tilt angles "
-                        "are {}".format(self._angle_to_string(tilts[0])))
+                return ("The corner-sharing octahedral tilt angles are "
+                        f"{self._angle_to_string(tilts[0])}")
 
         # otherwise just detail the spread of bond lengths
-        return "The corner-sharing octahedral tilt angles range from {}".format(
-            self._angle_range_to_string(min(tilts), max(tilts)))
+        s_range = self._angle_range_to_string(min(tilts), max(tilts))
+        return f"The corner-sharing octahedral tilt angles range from {s_range}"
 
     def _filter_seen_bonds(self, from_site: int, to_sites: List[int]
                            ) -> List[int]:
@@ -680,35 +818,31 @@ class StructureDescriber(object):
 
     def _rounded_bond_lengths(self, data: List[float]) -> Tuple[float]:
         """Function to round bond lengths to a number of decimal places."""
-        return tuple(float("{:.{}f}".format(x, self.bond_length_decimal_places))
-                     for x in data)
+        return tuple(np.round(np.asarray(data, dtype=np.float64),
+                              self.bond_length_decimal_places).tolist())
 
     def _distance_to_string(self, distance: float) -> str:
         """Utility function to round a distance and add an Angstrom symbol."""
-        return "{:.{}f} {}".format(distance, self.bond_length_decimal_places,
-                                   self.angstrom)
+        return f"{distance:.{self.bond_length_decimal_places}f} {self.angstrom}"
 
     def _distance_range_to_string(self, dist_a: float, dist_b: float) -> str:
         """Utility function to format a range of distances."""
-        return "{:.{}f}–{:.{}f} {}".format(
-            dist_a, self.bond_length_decimal_places,
-            dist_b, self.bond_length_decimal_places, self.angstrom)
+        places = self.bond_length_decimal_places
+        return f"{dist_a:.{places}f}–{dist_b:.{places}f} {self.angstrom}"
 
     def _rounded_angles(self, data: List[float]) -> Tuple[float]:
         """Function to round angles to a number of decimal places."""
-        return tuple(float("{:.{}f}".format(x, self.angle_decimal_places))
-                     for x in data)
+        return tuple(np.round(np.asarray(data, dtype=np.float64),
+                              self.angle_decimal_places).tolist())
 
     def _angle_to_string(self, angle: float) -> str:
         """Utility function to round a distance and add an Angstrom symbol."""
-        return "{:.{}f}{}".format(angle, self.angle_decimal_places,
-                                  self.degree)
+        return f"{angle:.{self.angle_decimal_places}f}{self.degree}"
 
     def _angle_range_to_string(self, angle_a: float, angle_b: float) -> str:
         """Utility function to format a range of distances."""
-        return "{:.{}f}–{:.{}f}{}".format(angle_a, self.angle_decimal_places,
-                                          angle_b, self.angle_decimal_places,
-                                          self.degree)
+        places = self.angle_decimal_places
+        return f"{angle_a:.{places}f}–{angle_b:.{places}f}{self.degree}"
 
 
 def get_mineral_name(mineral_dict: Dict[str, Any]) -> Union[str, None]:
@@ -729,7 +863,7 @@ def get_mineral_name(mineral_dict: Dict[str, Any]) -> Union[str, None]:
         else:
             suffix = ""
 
-        return "{}{}".format(mineral_dict['type'], suffix)
+        return f"{mineral_dict['type']}{suffix}"
 
     else:
         return None
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from robocrys import StructureDescriber
 from robocrys.tests import RobocrysTest
 
@@ -82,3 +84,38 @@ class TestDescriptionMethods(RobocrysTest):
         self.assertTrue(".." not in description)
         self.assertTrue("  " not in description)
         self.assertTrue(". ." not in description)
+
+    def test_describe_cached(self):
+        """Check repeated descriptions of the same structure are cached."""
+        d = StructureDescriber(return_parts=True)
+        with patch.object(d, '_get_description',
+                          wraps=d._get_description) as get_description:
+            description = d.describe(self.tin_dioxide)
+            description['mineral'] = ""
+            d.describe(self.mapi)
+            self.assertTrue(
+                "Rutile" in d.describe(self.tin_dioxide)['mineral'])
+            self.assertEqual(get_description.call_count, 2)
+            self.assertEqual(len(d._cache), 2)
+
+            # the adapter should be restored to the cached structure
+            self.assertEqual(d._da.mineral['type'], 'Rutile')
+
+            # changing an option should regenerate the description
+            d.describe_bond_lengths = False
+            self.assertFalse(
+                "2.09" in d.describe(self.tin_dioxide)['components'])
+            self.assertEqual(get_description.call_count, 3)
+
+    def test_describe_many(self):
+        """Check describing multiple structures matches describing each."""
+        d = StructureDescriber()
+        structures = [self.tin_dioxide, self.mapi] * 4
+        expected = [d.describe(s) for s in structures]
+
+        # one structure per chunk so the results come from several processes
+        descriptions = d.describe_many(structures, n_workers=2, chunksize=1)
+        self.assertEqual(descriptions, expected)
+
+        descriptions = d.describe_many(structures, n_workers=2)
+        self.assertEqual(descriptions, expected)
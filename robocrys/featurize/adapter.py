@@ -2,10 +2,13 @@
 This module implements a class to resolve the symbolic references in condensed
 structure data.
 """
-import collections
+import collections.abc
+from collections import Counter, defaultdict
 from statistics import mean
 from typing import Dict, Any, List, Optional, Union, Set
 
+import numpy as np
+
 from robocrys.adapter import BaseAdapter
 
 
@@ -23,12 +26,42 @@ class FeaturizerAdapter(BaseAdapter):
         self._all_sites = [site for component_index in
                            self.component_makeup for site in
                            self.components[component_index]['sites']]
+        self._n_all_sites = len(self._all_sites)
         self._distorted_tol = distorted_tol
 
+        # per-site data for all sites in the structure, stored as arrays so the
+        # fractional and geometry features can use vectorised reductions
+        all_sites = [self.sites[site] for site in self._all_sites]
+        self._site_has_poly = np.array(
+            [bool(s['poly_formula']) for s in all_sites], dtype=bool)
+        self._site_geometry = np.array(
+            [s['geometry']['type'] for s in all_sites], dtype=object)
+        self._site_likeness = np.array(
+            [s['geometry']['likeness'] for s in all_sites], dtype=np.float64)
+        self._site_n_neighbors = np.array(
+            [len(s['nn']) for s in all_sites], dtype=int)
+
+        # reverse lookups from geometry and connectivity to the sites with them
+        geometry_sites = defaultdict(list)
+        connectivity_sites = defaultdict(set)
+        for site, site_data in zip(self._all_sites, all_sites):
+            geometry_sites[site_data['geometry']['type']].append(site)
+            for connectivity in site_data['nnn']:
+                connectivity_sites[connectivity].add(site)
+        self._geometry_sites: Dict[str, List[int]] = dict(geometry_sites)
+        self._connectivity_sites: Dict[str, Set[int]] = dict(
+            connectivity_sites)
+
+        dimensionalities = [c['dimensionality']
+                            for c in self.components.values()]
+        self._component_dimensionalities = sorted(dimensionalities)
+        self._component_dimensionality_counts = Counter(dimensionalities)
+        self._component_dimensionality_set = set(dimensionalities)
+
     @property
     def component_dimensionalities(self) -> List[int]:
         """The dimensionalities of all components."""
-        return sorted(c['dimensionality'] for c in self.components.values())
+        return self._component_dimensionalities
 
     @property
     def contains_named_molecule(self) -> bool:
@@ -43,77 +76,73 @@ class FeaturizerAdapter(BaseAdapter):
     @property
     def is_intercalated(self) -> bool:
         """Whether the structure is intercalated."""
-        return 0 in self.component_dimensionalities
+        return 0 in self._component_dimensionality_counts
 
     @property
     def is_interpenetrated(self) -> bool:
         """Whether the structure is interpenetrated."""
-        return self.component_dimensionalities.count(3) > 1
+        return self._component_dimensionality_counts[3] > 1
 
     @property
     def contains_corner_sharing_polyhedra(self) -> bool:
         """Whether the structure contains corner-sharing polyhedra."""
-        # criteria: original site poly, nnn site poly and sites corner-sharing
-        return any([site for site in self.sites.values()
-                    if site['poly_formula'] and 'corner' in site['nnn']
-                    and any(self.sites[nnn_site]['poly_formula'] for nnn_site in
-                            site['nnn']['corner'])])
+        return self._contains_connected_polyhedra('corner')
 
     @property
     def contains_edge_sharing_polyhedra(self) -> bool:
         """Whether the structure contains edge-sharing polyhedra."""
-        # criteria: original site poly, nnn site poly and sites edge-sharing
-        return any([site for site in self.sites.values()
-                    if site['poly_formula'] and 'edge' in site['nnn']
-                    and any(self.sites[nnn_site]['poly_formula'] for nnn_site in
-                            site['nnn']['edge'])])
+        return self._contains_connected_polyhedra('edge')
 
     @property
     def contains_face_sharing_polyhedra(self) -> bool:
         """Whether the structure contains face-sharing polyhedra."""
-        # criteria: original site poly, nnn site poly and sites face-sharing
-        return any([site for site in self.sites.values()
-                    if site['poly_formula'] and 'face' in site['nnn']
-                    and any(self.sites[nnn_site]['poly_formula'] for nnn_site in
-                            site['nnn']['face'])])
+        return self._contains_connected_polyhedra('face')
 
     @property
     def frac_sites_polyhedra(self) -> float:
         """The percentage of sites that are connected polyhedra."""
-        return sum(bool(self.sites[site]['poly_formula']) for site in
-                   self._all_sites) / len(self._all_sites)
+        n = self._n_all_sites
+        return np.count_nonzero(self._site_has_poly) / n if n else 0.0
 
     @property
     def average_corner_sharing_octahedral_tilt_angle(self) -> float:
         """The average corner-sharing octahedral tilt angle."""
-        oct_sites = [site for component_index in self.component_makeup
-                     for site in self.components[component_index]['sites']
-                     if self.sites[site]['geometry']['type'] == 'octahedral' and
-                     'corner' in self.sites[site]['nnn']]
-
-        angles = []
-        for site in oct_sites:
-            nnn_sites = [
-                nnn_site for nnn_site in self.sites[site]['nnn']['corner']
-                if self.sites[nnn_site]['geometry']['type'] == 'octahedral']
-            angles.extend([abs(180 - angle) for nnn_site in nnn_sites for
-                           angle in self.angles[site][nnn_site]['corner']])
-
-        if angles:
-            return mean(angles)
+        sites = self.sites
+        angles = self.angles
+
+        # accumulate the tilt angles in a single pass over the octahedra
+        total = 0.
+        n_angles = 0
+        for site in self._geometry_sites.get('octahedral', ()):
+            site_data = sites[site]
+            if 'corner' not in site_data['nnn']:
+                continue
+
+            for nnn_site in site_data['nnn']['corner']:
+                if sites[nnn_site]['geometry']['type'] != 'octahedral':
+                    continue
+
+                for angle in angles[site][nnn_site]['corner']:
+                    total += abs(180 - angle)
+                    n_angles += 1
+
+        if n_angles:
+            return total / n_angles
         else:
             return None
 
     @property
     def average_coordination_number(self):
         """The average coordination number across all sites."""
-        return mean([len(self.sites[site]['nn']) for site in self._all_sites])
+        sites = self.sites
+        return mean([len(sites[site]['nn']) for site in self._all_sites])
 
     @property
     def average_cation_coordination_number(self):
         """The average coordination number across cation sites."""
-        cns = [len(self.sites[site]['nn']) for site in self._all_sites
-               if '+' in self.sites[site]['element']]
+        sites = self.sites
+        cns = [len(sites[site]['nn']) for site in self._all_sites
+               if '+' in sites[site]['element']]
         if cns:
             return mean(cns)
         else:
@@ -123,8 +152,9 @@ class FeaturizerAdapter(BaseAdapter):
     @property
     def average_anion_coordination_number(self):
         """The average coordination number across anion sites."""
-        cns = [len(self.sites[site]['nn']) for site in self._all_sites
-               if '-' in self.sites[site]['element']]
+        sites = self.sites
+        cns = [len(sites[site]['nn']) for site in self._all_sites
+               if '-' in sites[site]['element']]
         if cns:
             return mean(cns)
         else:
@@ -155,13 +185,9 @@ class FeaturizerAdapter(BaseAdapter):
             Whether the structure only contains the specified dimensionalities.
 
         """
-        if isinstance(dimensionalities, set):
-            set_dimensionalities = dimensionalities
-        elif isinstance(dimensionalities, collections.Iterable):
-            set_dimensionalities = set(dimensionalities)
-        else:
-            set_dimensionalities = {dimensionalities}
-        return set(self.component_dimensionalities) == set_dimensionalities
+        if not isinstance(dimensionalities, collections.abc.Iterable):
+            dimensionalities = {dimensionalities}
+        return self._component_dimensionality_set == set(dimensionalities)
 
     def contains_geometry_type(self, geometry: str,
                                distorted: Optional[bool] = None) -> bool:
@@ -177,16 +203,15 @@ class FeaturizerAdapter(BaseAdapter):
             Whether the structure contains a specific geometry.
         """
         if distorted is None:
-            return any(s['geometry']['type'] == geometry
-                       for s in self.sites.values())
-        elif distorted:
-            return any(s['geometry']['type'] == geometry and
-                       s['geometry']['likeness'] < self._distorted_tol
-                       for s in self.sites.values())
+            return geometry in self._geometry_sites
+
+        matches = self._site_geometry == geometry
+        if distorted:
+            return bool(np.any(matches &
+                               (self._site_likeness < self._distorted_tol)))
         else:
-            return any(s['geometry']['type'] == geometry and
-                       s['geometry']['likeness'] > self._distorted_tol
-                       for s in self.sites.values())
+            return bool(np.any(matches &
+                               (self._site_likeness > self._distorted_tol)))
 
     def contains_connected_geometry(self, connectivity: str, geometry: str
                                     ) -> bool:
@@ -199,13 +224,13 @@ class FeaturizerAdapter(BaseAdapter):
         Returns:
             Whether the structure contains the specified connected geometry.
         """
+        sites = self.sites
         return any(
-            [site for site in self.sites.values()
-             if site['poly_formula'] and site['geometry']['type'] == geometry
-             and connectivity in site['nnn']
-             and any(self.sites[nnn_site]['poly_formula'] for nnn_site in
-                     site['nnn'][connectivity] if
-                     self.sites[nnn_site]['geometry']['type'] == geometry)])
+            sites[site]['poly_formula'] and connectivity in sites[site]['nnn']
+            and any(sites[nnn_site]['poly_formula'] for nnn_site in
+                    sites[site]['nnn'][connectivity] if
+                    sites[nnn_site]['geometry']['type'] == geometry)
+            for site in self._geometry_sites.get(geometry, ()))
 
     def frac_site_geometry(self, geometry: str) -> float:
         """The fraction of sites with a specific geometry.
@@ -216,8 +241,8 @@ class FeaturizerAdapter(BaseAdapter):
         Returns:
             The fraction of sites with the specified geometry.
         """
-        return sum(self.sites[site]['geometry']['type'] == geometry for site in
-                   self._all_sites) / len(self._all_sites)
+        n = self._n_all_sites
+        return len(self._geometry_sites.get(geometry, ())) / n if n else 0.0
 
     def frac_sites_n_coordinate(self, num_neighbors: str) -> float:
         """The fraction of sites with a specific coordination number.
@@ -228,11 +253,29 @@ class FeaturizerAdapter(BaseAdapter):
         Returns:
             The fraction of sites with the specified coordination number.
         """
-        return sum(len(self.sites[site]['nn']) == num_neighbors for site in
-                   self._all_sites) / len(self._all_sites)
+        n = self._n_all_sites
+        return (np.count_nonzero(self._site_n_neighbors == num_neighbors) / n
+                if n else 0.0)
 
     def all_bond_lengths(self):
         return [d for site_b in self.distances.values()
                 for site_dists in site_b.values() for d in site_dists]
 
+    def _contains_connected_polyhedra(self, connectivity: str) -> bool:
+        """Whether the structure contains polyhedra with a connectivity.
+
+        Args:
+            connectivity: The connectivity (corner, edge, face).
+
+        Returns:
+            Whether the structure contains polyhedra that are connected to
+            other polyhedra with the specified connectivity.
+        """
+        # criteria: original site poly, nnn site poly and sites connected
+        sites = self.sites
+        return any(sites[site]['poly_formula'] and
+                   any(sites[nnn_site]['poly_formula'] for nnn_site in
+                       sites[site]['nnn'][connectivity])
+                   for site in self._connectivity_sites.get(connectivity, ()))
+
 
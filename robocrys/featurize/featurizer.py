@@ -24,6 +24,8 @@ _dimensionality_sets = ((3, 2, 1, 0), (3, 2, 1), (3, 2, 0), (3, 1, 0),
                         (1, 0))
 _molecules = ['water', 'oxygen', 'ammonia', 'methane']
 _connectivities = ['corner', 'edge', 'face']
+_connectivity_geometry_pairs = tuple(product(_connectivities,
+                                             connected_geometries))
 _cns = range(1, 13)
 
 
@@ -85,8 +87,8 @@ class RobocrysFeaturizer(BaseFeaturizer):
                      fa.contains_face_sharing_polyhedra]
 
         # add connectivity features
-        features += [fa.contains_connected_geometry(c, g) for c, g in
-                     product(_connectivities, connected_geometries)]
+        features += [fa.contains_connected_geometry(c, g)
+                     for c, g in _connectivity_geometry_pairs]
         features += [fa.average_corner_sharing_octahedral_tilt_angle]
 
         # add fractional features
@@ -129,8 +131,8 @@ class RobocrysFeaturizer(BaseFeaturizer):
                    'contains_face_sharing_polyhedra']
 
         # connectivity features
-        labels += ['contains_{}_{}'.format(c, g) for c, g in
-                   product(_connectivities, connected_geometries)]
+        labels += ['contains_{}_{}'.format(c, g)
+                   for c, g in _connectivity_geometry_pairs]
         labels += ['corner_sharing_octahedral_tilt_angle']
 
         # fractional features
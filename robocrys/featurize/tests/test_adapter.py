@@ -0,0 +1,120 @@
+import numpy as np
+
+from robocrys.featurize.adapter import FeaturizerAdapter
+from robocrys.tests import RobocrysTest
+
+
+class TestFeaturizerAdapter(RobocrysTest):
+    """Class to test the featurizer adapter functionality."""
+
+    def setUp(self):
+        tin_dioxide = self.get_condensed_structure("SnO2")
+        self.tin_dioxide_fa = FeaturizerAdapter(tin_dioxide)
+
+        mapi = self.get_condensed_structure("mapi")
+        self.mapi_fa = FeaturizerAdapter(mapi)
+
+    def test_dimensionality_features(self):
+        """Check the component dimensionality features."""
+        self.assertEqual(self.tin_dioxide_fa.component_dimensionalities, [3])
+        self.assertFalse(self.tin_dioxide_fa.is_intercalated)
+        self.assertFalse(self.tin_dioxide_fa.is_interpenetrated)
+        self.assertTrue(self.tin_dioxide_fa.is_dimensionality(3))
+        self.assertTrue(self.tin_dioxide_fa.is_dimensionality(np.int64(3)))
+        self.assertFalse(self.tin_dioxide_fa.is_dimensionality((3, 0)))
+
+        self.assertEqual(self.mapi_fa.component_dimensionalities, [0, 3])
+        self.assertTrue(self.mapi_fa.is_intercalated)
+        self.assertFalse(self.mapi_fa.is_interpenetrated)
+        self.assertFalse(self.mapi_fa.is_dimensionality(3))
+        self.assertTrue(self.mapi_fa.is_dimensionality((3, 0)))
+        self.assertTrue(self.mapi_fa.is_dimensionality({0, 3}))
+
+    def test_molecule_features(self):
+        """Check the molecule features."""
+        self.assertFalse(self.tin_dioxide_fa.contains_named_molecule)
+        self.assertTrue(self.mapi_fa.contains_named_molecule)
+        self.assertTrue(self.mapi_fa.contains_molecule('methylammonium'))
+        self.assertFalse(self.mapi_fa.contains_molecule('water'))
+
+    def test_geometry_features(self):
+        """Check the site geometry features."""
+        fa = self.tin_dioxide_fa
+        self.assertTrue(fa.contains_geometry_type('octahedral'))
+        self.assertFalse(fa.contains_geometry_type('octahedral',
+                                                   distorted=True))
+        self.assertTrue(fa.contains_geometry_type('octahedral',
+                                                  distorted=False))
+        self.assertFalse(fa.contains_geometry_type('tetrahedral'))
+        self.assertEqual(fa.frac_site_geometry('octahedral'), 0.5)
+        self.assertEqual(fa.frac_site_geometry('trigonal planar'), 0.5)
+        self.assertEqual(fa.frac_site_geometry('tetrahedral'), 0.)
+        self.assertEqual(fa.average_coordination_number, 4.5)
+        self.assertEqual(fa.average_cation_coordination_number, 6)
+        self.assertEqual(fa.average_anion_coordination_number, 3)
+
+        fa = self.mapi_fa
+        self.assertTrue(fa.contains_geometry_type('linear', distorted=True))
+        self.assertFalse(fa.contains_geometry_type('linear', distorted=False))
+        self.assertAlmostEqual(fa.frac_site_geometry('tetrahedral'), 8 / 27)
+        self.assertAlmostEqual(fa.frac_site_geometry('octahedral'), 1 / 27)
+        self.assertAlmostEqual(fa.average_coordination_number, 58 / 27)
+        self.assertAlmostEqual(fa.average_cation_coordination_number,
+                               1.2941176470588236)
+        self.assertAlmostEqual(fa.average_anion_coordination_number, 3.6)
+
+    def test_polyhedra_features(self):
+        """Check the connected polyhedra features."""
+        fa = self.tin_dioxide_fa
+        self.assertTrue(fa.contains_polyhedra)
+        self.assertTrue(fa.contains_corner_sharing_polyhedra)
+        self.assertTrue(fa.contains_edge_sharing_polyhedra)
+        self.assertFalse(fa.contains_face_sharing_polyhedra)
+        self.assertTrue(fa.contains_connected_geometry('corner', 'octahedral'))
+        self.assertTrue(fa.contains_connected_geometry('edge', 'octahedral'))
+        self.assertFalse(fa.contains_connected_geometry('face', 'octahedral'))
+        self.assertFalse(
+            fa.contains_connected_geometry('corner', 'tetrahedral'))
+        self.assertEqual(fa.frac_sites_polyhedra, 0.5)
+        self.assertAlmostEqual(fa.average_corner_sharing_octahedral_tilt_angle,
+                               50.81150469850658)
+
+        fa = self.mapi_fa
+        self.assertTrue(fa.contains_corner_sharing_polyhedra)
+        self.assertFalse(fa.contains_edge_sharing_polyhedra)
+        self.assertFalse(fa.contains_face_sharing_polyhedra)
+        self.assertTrue(fa.contains_connected_geometry('corner', 'octahedral'))
+        self.assertAlmostEqual(fa.frac_sites_polyhedra, 1 / 27)
+        self.assertAlmostEqual(fa.average_corner_sharing_octahedral_tilt_angle,
+                               23.61059632090613)
+
+    def test_frac_sites_n_coordinate(self):
+        """Check the fraction of sites with each coordination number."""
+        self.assertEqual(
+            [self.tin_dioxide_fa.frac_sites_n_coordinate(n)
+             for n in range(1, 13)],
+            [0., 0., 0.5, 0., 0., 0.5, 0., 0., 0., 0., 0., 0.])
+
+        mapi_fracs = [self.mapi_fa.frac_sites_n_coordinate(n)
+                      for n in range(1, 13)]
+        for frac, expected in zip(mapi_fracs, [16 / 27, 2 / 27, 0., 8 / 27,
+                                               0., 1 / 27, 0., 0., 0., 0., 0.,
+                                               0.]):
+            self.assertAlmostEqual(frac, expected)
+
+    def test_empty_structure(self):
+        """Check features of a structure without any sites."""
+        empty = self.get_condensed_structure("SnO2")
+        empty.update(sites={}, distances={}, angles={}, components={},
+                     component_makeup=[])
+        fa = FeaturizerAdapter(empty)
+
+        self.assertEqual(fa.frac_sites_polyhedra, 0.)
+        self.assertEqual(fa.frac_site_geometry('octahedral'), 0.)
+        self.assertEqual(fa.frac_sites_n_coordinate(6), 0.)
+        self.assertFalse(fa.contains_polyhedra)
+        self.assertFalse(fa.contains_corner_sharing_polyhedra)
+        self.assertFalse(fa.contains_geometry_type('octahedral'))
+        self.assertFalse(fa.contains_geometry_type('octahedral',
+                                                   distorted=True))
+        self.assertIsNone(fa.average_corner_sharing_octahedral_tilt_angle)
@@ -14,18 +14,23 @@ Attributes:
 """
 import re
 from collections import defaultdict
+from functools import lru_cache
 from typing import Union, Dict, List, Any
 
+try:
+    from importlib.resources import files
+except ImportError:
+    from importlib_resources import files
+
 from monty.json import MontyDecoder
 from monty.serialization import loadfn
-from pkg_resources import resource_filename
 
 from pymatgen import Element, Specie
 from pymatgen.core.periodic_table import get_el_sp
 from pymatgen.util.string import latexify_spacegroup
 
 common_formulas: Dict[str, str] = loadfn(
-    resource_filename('robocrys.condense', 'formula_db.json.gz'))
+    str(files('robocrys.condense').joinpath('formula_db.json.gz')))
 
 connected_geometries: List[str] = [
     'tetrahedral', 'octahedral', 'trigonal pyramidal',
@@ -61,10 +66,16 @@ polyhedra_plurals: Dict[str, str] = {
 dimensionality_to_shape: Dict[int, str] = {
     3: 'framework', 2: 'sheet', 1: 'ribbon', 0: 'cluster'}
 
+_superscript_table = str.maketrans("0123456789-+", "⁰¹²³⁴⁵⁶⁷⁸⁹⁻⁺")
+
 
+@lru_cache(maxsize=128)
 def get_el(obj: Union[Element, Specie, str, int]) -> str:
     """Utility method to get an element str from a symbol, Element, or Specie.
 
+    The results are cached as the same few species strings are looked up
+    repeatedly when analysing and describing a structure.
+
     Args:
         obj: An arbitrary object. Spported objects are Element/Specie objects,
             integers (representing atomic numbers), or strings (element
@@ -170,13 +181,7 @@ def superscript_number(string):
         # no unicode period exists
         return string
 
-    subscript_unicode_map = {0: '⁰', 1: '¹', 2: '²', 3: '³', 4: '⁴', 5: '⁵',
-                             6: '⁶', 7: '⁷', 8: '⁸', 9: '⁹', "-": "⁻", "+": "⁺"}
-
-    for original_subscript, subscript_unicode in subscript_unicode_map.items():
-        string = string.replace(str(original_subscript), subscript_unicode)
-
-    return string
+    return string.translate(_superscript_table)
 
 
 def unicodeify_spacegroup(spacegroup_symbol: str) -> str:
@@ -37,7 +37,7 @@ setup(
     packages=find_packages(),
     install_requires=['spglib', 'numpy', 'scipy', 'pymatgen>=2017.12.30',
                       'inflect', 'networkx', 'matminer>=0.6.3', 'monty', 'pubchempy',
-                      'pybtex'],
+                      'pybtex', "importlib_resources; python_version < '3.9'"],
     extras_require={'docs': ['sphinx', 'sphinx-argparse', 'sphinx_rtd_theme',
                              'sphinx-autodoc-typehints', 'm2r'],
                     'dev': ['tqdm', 'pybel', 'pebble', 'maggma'],